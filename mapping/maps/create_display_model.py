@@ -8,117 +8,153 @@ Each display is a flat quad with proper UV mapping (0-1 range).
 """
 
 import os
-import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 XONOTIC_DIR = Path("/home/scott/Games/Xonotic")
 MODELS_DIR = XONOTIC_DIR / "data" / "models" / "displays"
 TEXTURES_DIR = XONOTIC_DIR / "data" / "textures" / "rustchain"
 
+# One material library shared by every display OBJ
+DISPLAYS_MTL = "displays.mtl"
+
+
+# Vertices: bottom-left, bottom-right, top-right, top-left
+# Quad faces +Y (north), so X is horizontal, Z is vertical
+# UV coordinates are 0-1 range, mapping the entire texture
+_QUAD_BODY_TEMPLATE = """\
+v %(left)s 0 0
+v %(right)s 0 0
+v %(right)s 0 %(height)s
+v %(left)s 0 %(height)s
+vt 0 0
+vt 1 0
+vt 1 1
+vt 0 1
+vn 0 1 0
+"""
 
-def create_quad_obj(name: str, width: float, height: float, texture_path: str) -> str:
-    """
-    Create an OBJ file for a textured quad.
+# Whole OBJ for one display, filled in a single formatting pass.
+# Double-sided: front face CCW (visible from +Y), back face CW (from -Y)
+_QUAD_OBJ_TEMPLATE = """\
+# Display quad: %(name)s
+# Size: %(width)sx%(height)s units
+# Texture: %(texture_path)s
 
-    The quad is centered at origin, facing +Y direction (north).
-    UV coords are 0-1, so texture maps perfectly regardless of world position.
-    """
-    hw = width / 2
-    hh = height / 2
-
-    # Vertices: bottom-left, bottom-right, top-right, top-left
-    # Quad faces +Y (north), so X is horizontal, Z is vertical
-    vertices = [
-        (-hw, 0, 0),      # bottom-left
-        (hw, 0, 0),       # bottom-right
-        (hw, 0, height),  # top-right
-        (-hw, 0, height), # top-left
-    ]
+mtllib %(mtllib)s
 
-    # UV coordinates (0-1 range, maps entire texture)
-    uvs = [
-        (0, 0),  # bottom-left
-        (1, 0),  # bottom-right
-        (1, 1),  # top-right
-        (0, 1),  # top-left
-    ]
+o %(name)s
+%(body)s
+usemtl %(name)s_mat
+f 1/1/1 2/2/1 3/3/1 4/4/1
+f 4/4/1 3/3/1 2/2/1 1/1/1
+"""
 
-    # Face (quad as two triangles)
-    # Front face (visible from +Y)
+_MTL_TEMPLATE = """\
+# Material for {name}
+newmtl {name}_mat
+Ka 1.0 1.0 1.0
+Kd 1.0 1.0 1.0
+Ks 0.0 0.0 0.0
+Ns 0
+d 1.0
+illum 1
+map_Kd {texture_path}
+"""
 
-    obj_content = f"""# Display quad: {name}
-# Size: {width}x{height} units
-# Texture: {texture_path}
 
-mtllib {name}.mtl
+def _coord(value: float):
+    """Return value as an int when it is integral, so it formats without '.0'."""
+    return int(value) if value == int(value) else value
 
-o {name}
-"""
 
-    # Vertices
-    for v in vertices:
-        obj_content += f"v {v[0]} {v[1]} {v[2]}\n"
+@lru_cache(maxsize=32)
+def _quad_body(width: float, height: float) -> str:
+    """Geometry lines (v/vt/vn) for a quad; shared by every display of that size."""
+    hw = _coord(width / 2)
+    return _QUAD_BODY_TEMPLATE % {"left": -hw, "right": hw, "height": _coord(height)}
 
-    # Texture coordinates
-    for uv in uvs:
-        obj_content += f"vt {uv[0]} {uv[1]}\n"
 
-    # Normals (facing +Y)
-    obj_content += "vn 0 1 0\n"
+# Every museum display is 256x256, so its geometry is built once at import
+_QUAD_BODY_256 = _quad_body(256, 256)
 
-    # Face with material - double-sided (front and back)
-    obj_content += f"\nusemtl {name}_mat\n"
-    # Front face (CCW winding, visible from +Y)
-    obj_content += "f 1/1/1 2/2/1 3/3/1 4/4/1\n"
-    # Back face (CW winding, visible from -Y)
-    obj_content += "f 4/4/1 3/3/1 2/2/1 1/1/1\n"
 
-    return obj_content
+def create_quad_obj(name: str, width: float, height: float, texture_path: str) -> str:
+    """
+    Create an OBJ file for a textured quad.
+
+    The quad is centered at origin, facing +Y direction (north).
+    UV coords are 0-1, so texture maps perfectly regardless of world position.
+    Both faces are emitted (front CCW, back CW) so the quad is double-sided.
+    """
+    if width == 256 and height == 256:
+        body = _QUAD_BODY_256
+    else:
+        body = _quad_body(width, height)
+    return _QUAD_OBJ_TEMPLATE % {"name": name, "width": width, "height": height,
+                                 "texture_path": texture_path, "mtllib": DISPLAYS_MTL,
+                                 "body": body}
 
 
 def create_mtl(name: str, texture_path: str) -> str:
-    """Create MTL material file for the quad."""
-    return f"""# Material for {name}
-newmtl {name}_mat
-Ka 1.0 1.0 1.0
-Kd 1.0 1.0 1.0
-Ks 0.0 0.0 0.0
-Ns 0
-d 1.0
-illum 1
-map_Kd {texture_path}
-"""
+    """Create the MTL material entry for the quad."""
+    return _MTL_TEMPLATE.format_map({"name": name, "texture_path": texture_path})
 
 
-def create_display_model(name: str, texture_name: str, width: int = 256, height: int = 256):
+def _write_file(item):
     """
-    Create a complete display model (OBJ + MTL).
+    Write one (path, data) pair in binary mode, bypassing the text layer.
+
+    Skips the write when the file already holds exactly this data, so
+    re-running the generator doesn't touch mtimes or trigger IQM rebuilds.
+    Returns True if the file was written.
+    """
+    path, data = item
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def create_display_models(displays):
+    """
+    Create display models for a whole batch: one OBJ per display plus a
+    single shared MTL library holding every display's material.
 
     Args:
-        name: Model name (e.g., "museum_sign_display")
-        texture_name: Texture filename in rustchain folder (e.g., "museum_sign.png")
-        width: Display width in world units
-        height: Display height in world units
+        displays: Iterable of (name, texture_name, width, height) tuples, where
+            texture_name is a file in the rustchain texture folder and
+            width/height are in world units
+
+    Returns:
+        List of paths actually written (files already up to date are skipped),
+        OBJ for each display in order, then the MTL
     """
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
-    texture_path = f"textures/rustchain/{texture_name}"
-
-    # Create OBJ
-    obj_content = create_quad_obj(name, width, height, texture_path)
-    obj_path = MODELS_DIR / f"{name}.obj"
-    with open(obj_path, 'w') as f:
-        f.write(obj_content)
-    print(f"Created: {obj_path}")
+    # Plain string paths: one join per file instead of a PurePath per file
+    models_dir = os.fspath(MODELS_DIR) + os.sep
+    files = []
+    materials = []
+    for name, texture_name, width, height in displays:
+        texture_path = f"textures/rustchain/{texture_name}"
+        files.append((models_dir + name + ".obj",
+                      create_quad_obj(name, width, height, texture_path).encode()))
+        materials.append(create_mtl(name, texture_path))
+    files.append((models_dir + DISPLAYS_MTL, "\n".join(materials).encode()))
 
-    # Create MTL
-    mtl_content = create_mtl(name, texture_path)
-    mtl_path = MODELS_DIR / f"{name}.mtl"
-    with open(mtl_path, 'w') as f:
-        f.write(mtl_content)
-    print(f"Created: {mtl_path}")
+    # Files are independent and tiny, so overlap the open/write/close syscalls
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(files)))) as pool:
+        written = list(pool.map(_write_file, files))
 
-    return obj_path
+    return [path for (path, _), changed in zip(files, written) if changed]
 
 
 def main():
@@ -139,8 +175,11 @@ def main():
     print(f"Output directory: {MODELS_DIR}")
     print()
 
-    for name, texture, w, h in displays:
-        create_display_model(name, texture, w, h)
+    written = create_display_models(displays)
+    for path in written:
+        print(f"Created: {path}")
+    if not written:
+        print("All display models already up to date.")
 
     print()
     print("Done! Models created as OBJ files.")
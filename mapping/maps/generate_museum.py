@@ -25,117 +25,187 @@ Layout:
               (loops back to Main Hall)
 """
 
-import math
-
-def brush_box(x1, y1, z1, x2, y2, z2, textures, scale=0.25):
-    """Generate a solid box brush from min to max corners"""
-    if isinstance(textures, str):
-        textures = [textures] * 6
-
-    if x1 > x2: x1, x2 = x2, x1
-    if y1 > y2: y1, y2 = y2, y1
-    if z1 > z2: z1, z2 = z2, z1
-
-    s = scale
-    lines = ["{"]
-    # top, bottom, north, south, east, west
-    lines.append(f"( {x2} {y1} {z2} ) ( {x1} {y1} {z2} ) ( {x1} {y2} {z2} ) {textures[0]} 0 0 0 {s} {s} 0 0 0")
-    lines.append(f"( {x2} {y2} {z1} ) ( {x1} {y2} {z1} ) ( {x1} {y1} {z1} ) {textures[1]} 0 0 0 {s} {s} 0 0 0")
-    lines.append(f"( {x2} {y2} {z1} ) ( {x2} {y2} {z2} ) ( {x1} {y2} {z2} ) {textures[2]} 0 0 0 {s} {s} 0 0 0")
-    lines.append(f"( {x1} {y1} {z1} ) ( {x1} {y1} {z2} ) ( {x2} {y1} {z2} ) {textures[3]} 0 0 0 {s} {s} 0 0 0")
-    lines.append(f"( {x2} {y1} {z1} ) ( {x2} {y1} {z2} ) ( {x2} {y2} {z2} ) {textures[4]} 0 0 0 {s} {s} 0 0 0")
-    lines.append(f"( {x1} {y2} {z1} ) ( {x1} {y2} {z2} ) ( {x1} {y1} {z2} ) {textures[5]} 0 0 0 {s} {s} 0 0 0")
-    lines.append("}")
-    return "\n".join(lines)
-
-
-def entity(classname, properties):
-    """Generate a point entity"""
-    lines = ["{"]
-    lines.append(f'"classname" "{classname}"')
-    for key, value in properties.items():
-        lines.append(f'"{key}" "{value}"')
-    lines.append("}")
-    return "\n".join(lines)
-
-
-def misc_model(origin, model, angle=0, scale=1.0):
-    """Generate a misc_model entity"""
-    return entity("misc_model", {
-        "origin": origin,
-        "model": model,
-        "angle": str(angle),
-        "modelscale": str(scale)
-    })
+import sys
+from itertools import starmap
+
+# Texture for hidden faces and sealing brushes
+_CAULK = sys.intern("common/caulk")
+
+# Box brush faces in order: top, bottom, north, south, east, west
+# Fields: 0-2 = x1 y1 z1 (min), 3-5 = x2 y2 z2 (max), 6-11 = textures,
+# 12 = texture scale (baked in once per BrushBuffer)
+_BRUSH_TEMPLATE = """{{
+( {3} {1} {5} ) ( {0} {1} {5} ) ( {0} {4} {5} ) {6} 0 0 0 {12} {12} 0 0 0
+( {3} {4} {2} ) ( {0} {4} {2} ) ( {0} {1} {2} ) {7} 0 0 0 {12} {12} 0 0 0
+( {3} {4} {2} ) ( {3} {4} {5} ) ( {0} {4} {5} ) {8} 0 0 0 {12} {12} 0 0 0
+( {0} {1} {2} ) ( {0} {1} {5} ) ( {3} {1} {5} ) {9} 0 0 0 {12} {12} 0 0 0
+( {3} {1} {2} ) ( {3} {1} {5} ) ( {3} {4} {5} ) {10} 0 0 0 {12} {12} 0 0 0
+( {0} {4} {2} ) ( {0} {4} {5} ) ( {0} {1} {5} ) {11} 0 0 0 {12} {12} 0 0 0
+}}
+"""
 
+# Opening of the worldspawn entity; its brushes and closing brace follow
+_WORLDSPAWN_HEADER = """{
+"classname" "worldspawn"
+"message" "RustChain Computing Museum"
+"author" "RustChain SDK"
+"_lightmapscale" "0.125"
+"_ambient" "30"
+"music" "sophia_arena/music/rustchainrevolution.ogg"
+"""
 
-def make_room(output, x1, y1, x2, y2, height, floor_tex, wall_tex, ceil_tex, W=32):
-    """Create a sealed room with floor, ceiling, and 4 walls"""
-    CAULK = "common/caulk"
+# Fixed-schema point entities, filled positionally from their list rows
+# Fields: 0 = origin (x, y, z), 1 = angle
+_SPAWN_TEMPLATE = """{{
+"classname" "info_player_deathmatch"
+"origin" "{0[0]} {0[1]} {0[2]}"
+"angle" "{1}"
+}}
+"""
 
-    # Floor
-    output.append(brush_box(x1, y1, -W, x2, y2, 0,
-                            [floor_tex, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    # Ceiling
-    output.append(brush_box(x1, y1, height, x2, y2, height + W,
-                            [CAULK, ceil_tex, CAULK, CAULK, CAULK, CAULK]))
-    # North wall
-    output.append(brush_box(x1, y2, 0, x2, y2 + W, height, wall_tex))
-    # South wall
-    output.append(brush_box(x1, y1 - W, 0, x2, y1, height, wall_tex))
-    # East wall
-    output.append(brush_box(x2, y1, 0, x2 + W, y2, height, wall_tex))
-    # West wall
-    output.append(brush_box(x1 - W, y1, 0, x1, y2, height, wall_tex))
-
-
-def make_corridor(output, x1, y1, x2, y2, height, floor_tex, wall_tex, ceil_tex, W=32):
-    """Create a corridor segment (floor + ceiling, walls on long sides)"""
-    CAULK = "common/caulk"
-
-    # Determine orientation
-    dx = abs(x2 - x1)
-    dy = abs(y2 - y1)
+# Fields: 0 = classname, 1 = origin (x, y, z)
+_PICKUP_TEMPLATE = """{{
+"classname" "{0}"
+"origin" "{1[0]} {1[1]} {1[2]}"
+}}
+"""
 
-    # Floor
-    output.append(brush_box(x1, y1, -W, x2, y2, 0,
-                            [floor_tex, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    # Ceiling
-    output.append(brush_box(x1, y1, height, x2, y2, height + W,
-                            [CAULK, ceil_tex, CAULK, CAULK, CAULK, CAULK]))
+# Fields: 0 = origin (x, y, z), 1 = light, 2 = color
+_LIGHT_TEMPLATE = """{{
+"classname" "light"
+"origin" "{0[0]} {0[1]} {0[2]}"
+"light" "{1}"
+"_color" "{2}"
+}}
+"""
 
-    if dx > dy:  # East-West corridor - walls on north/south
-        output.append(brush_box(x1, y2, 0, x2, y2 + W, height, wall_tex))
-        output.append(brush_box(x1, y1 - W, 0, x2, y1, height, wall_tex))
-    else:  # North-South corridor - walls on east/west
-        output.append(brush_box(x2, y1, 0, x2 + W, y2, height, wall_tex))
-        output.append(brush_box(x1 - W, y1, 0, x1, y2, height, wall_tex))
+# Fields: 0 = origin (x, y, z), 1 = model, 2 = angle, 3 = scale
+_MODEL_TEMPLATE = """{{
+"classname" "misc_model"
+"origin" "{0[0]} {0[1]} {0[2]}"
+"model" "{1}"
+"angle" "{2}"
+"modelscale" "{3}"
+}}
+"""
 
 
-def generate_museum():
-    """Generate the RustChain Computing Museum with arena flow"""
+def _normalize_box(x1, y1, z1, x2, y2, z2):
+    """Return box corners as (min x, min y, min z, max x, max y, max z)"""
+    if x1 > x2: x1, x2 = x2, x1
+    if y1 > y2: y1, y2 = y2, y1
+    if z1 > z2: z1, z2 = z2, z1
+    return x1, y1, z1, x2, y2, z2
+
+
+class BrushBuffer:
+    """
+    Collects box brushes as rows of coordinates and textures, and formats
+    them all in one pass when rendered. Every brush in a buffer shares the
+    same texture scale, which is baked into the brush template up front.
+    """
+
+    def __init__(self, scale=0.25):
+        self.template = _BRUSH_TEMPLATE.replace("{12}", str(scale))
+        self.rows = []
+
+    def add(self, x1, y1, z1, x2, y2, z2, textures):
+        """Add a solid box brush from min to max corners"""
+        if isinstance(textures, str):
+            return self.add_uniform(x1, y1, z1, x2, y2, z2, textures)
+
+        self.rows.append((*_normalize_box(x1, y1, z1, x2, y2, z2), *textures))
+
+    def add_uniform(self, x1, y1, z1, x2, y2, z2, texture):
+        """Add a solid box brush with the same texture on all six faces"""
+        self.rows.append((*_normalize_box(x1, y1, z1, x2, y2, z2),
+                          texture, texture, texture, texture, texture, texture))
+
+    def add_many(self, boxes, textures):
+        """Add one brush per (x1, y1, z1, x2, y2, z2) box, all sharing textures"""
+        if isinstance(textures, str):
+            textures = (textures,) * 6
+        else:
+            textures = tuple(textures)
+
+        self.rows.extend([_normalize_box(*box) + textures for box in boxes])
+
+    def add_room(self, x1, y1, x2, y2, height, floor_tex, wall_tex, ceil_tex, W=32):
+        """Add a sealed room with floor, ceiling, and 4 walls"""
+        self.add(x1, y1, -W, x2, y2, 0,
+                 [floor_tex, _CAULK, _CAULK, _CAULK, _CAULK, _CAULK])
+        self.add(x1, y1, height, x2, y2, height + W,
+                 [_CAULK, ceil_tex, _CAULK, _CAULK, _CAULK, _CAULK])
+        # North, south, east and west walls
+        self.add_many([
+            (x1, y2, 0, x2, y2 + W, height),
+            (x1, y1 - W, 0, x2, y1, height),
+            (x2, y1, 0, x2 + W, y2, height),
+            (x1 - W, y1, 0, x1, y2, height),
+        ], wall_tex)
+
+    def add_corridor(self, x1, y1, x2, y2, height, floor_tex, wall_tex, ceil_tex, W=32):
+        """Add a corridor segment (floor + ceiling, walls on long sides)"""
+        self.add(x1, y1, -W, x2, y2, 0,
+                 [floor_tex, _CAULK, _CAULK, _CAULK, _CAULK, _CAULK])
+        self.add(x1, y1, height, x2, y2, height + W,
+                 [_CAULK, ceil_tex, _CAULK, _CAULK, _CAULK, _CAULK])
+
+        if abs(x2 - x1) > abs(y2 - y1):  # East-West corridor - walls on north/south
+            self.add_many([
+                (x1, y2, 0, x2, y2 + W, height),
+                (x1, y1 - W, 0, x2, y1, height),
+            ], wall_tex)
+        else:  # North-South corridor - walls on east/west
+            self.add_many([
+                (x2, y1, 0, x2 + W, y2, height),
+                (x1 - W, y1, 0, x1, y2, height),
+            ], wall_tex)
+
+    def write(self, out):
+        """Write every collected brush to a text stream, one brush per block"""
+        # Each coordinate appears up to nine times per brush, so convert the
+        # row to strings once rather than letting format() redo int -> str
+        fmt = self.template.format
+        out.writelines(fmt(*map(str, row)) for row in self.rows)
 
-    # Textures
-    FLOOR = "rustchain/rustchain_floor_plate_01"
-    CEILING = "eX/eX_mtl_panel_03_d"
-    WALL = "rustchain/rustchain_wall_panel_01"
-    WALL_ACCENT = "eX/eX_wall_panels_08_d"
-    TRIM = "eX/eX_trim_vert_01_d"
-    PILLAR_TEX = "rustchain/rustchain_wall_panel_01"
-    PEDESTAL = "eX/eX_floor_tread_01_d"
-    CAULK = "common/caulk"
-    FLOOR2 = "eX/eX_floor_mtl_grate_01_d"
 
-    output = []
+def misc_model(origin, model, angle=0, scale=1.0):
+    """Generate a misc_model entity"""
+    return _MODEL_TEMPLATE.format(origin, model, angle, scale)
+
+
+def generate_museum(out):
+    """
+    Generate the RustChain Computing Museum with arena flow.
+
+    The map is streamed to the text stream `out` as it is produced; pass an
+    io.StringIO to get it as a string.
+    """
+    # Textures (interned so every face row shares one string object)
+    FLOOR = sys.intern("rustchain/rustchain_floor_plate_01")
+    CEILING = sys.intern("eX/eX_mtl_panel_03_d")
+    WALL = sys.intern("rustchain/rustchain_wall_panel_01")
+    WALL_ACCENT = sys.intern("eX/eX_wall_panels_08_d")
+    TRIM = sys.intern("eX/eX_trim_vert_01_d")
+    PILLAR_TEX = sys.intern("rustchain/rustchain_wall_panel_01")
+    PEDESTAL = sys.intern("eX/eX_floor_tread_01_d")
+    CAULK = _CAULK
+    FLOOR2 = sys.intern("eX/eX_floor_mtl_grate_01_d")
+
+    # Per-face texture sets (top, bottom, north, south, east, west), built once
+    FLOOR_FACES = (FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK)
+    FLOOR2_FACES = (FLOOR2, CAULK, CAULK, CAULK, CAULK, CAULK)
+    CEIL_FACES = (CAULK, CEILING, CAULK, CAULK, CAULK, CAULK)
+    MEZZ_FACES = (FLOOR, CEILING, WALL, WALL, WALL, WALL)
+    STEP_FACES = (FLOOR, CAULK, TRIM, TRIM, TRIM, CAULK)
+    PED_FACES = (PEDESTAL, FLOOR, TRIM, TRIM, TRIM, TRIM)
+    PILLAR_FACES = (CEILING, FLOOR, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX)
+
+    brushes = BrushBuffer()
 
     # Worldspawn
-    output.append('{')
-    output.append('"classname" "worldspawn"')
-    output.append('"message" "RustChain Computing Museum"')
-    output.append('"author" "RustChain SDK"')
-    output.append('"_lightmapscale" "0.125"')
-    output.append('"_ambient" "30"')
-    output.append('"music" "sophia_arena/music/rustchainrevolution.ogg"')
+    out.write(_WORLDSPAWN_HEADER)
 
     # ============================================
     # DIMENSIONS - Expanded for arena flow
@@ -148,24 +218,28 @@ def generate_museum():
     FOUND_Y_S = -2400
     FOUND_Z_TOP = 450
     # Floor foundation
-    output.append(brush_box(-FOUND_X, FOUND_Y_S, -64, FOUND_X, FOUND_Y_N, -W, CAULK))
-    # Ceiling seal
-    output.append(brush_box(-FOUND_X, FOUND_Y_S, FOUND_Z_TOP, FOUND_X, FOUND_Y_N, FOUND_Z_TOP + W, CAULK))
-    # Outer walls (complete box)
-    output.append(brush_box(-FOUND_X - W, FOUND_Y_S, -64, -FOUND_X, FOUND_Y_N, FOUND_Z_TOP + W, CAULK))  # West
-    output.append(brush_box(FOUND_X, FOUND_Y_S, -64, FOUND_X + W, FOUND_Y_N, FOUND_Z_TOP + W, CAULK))  # East
-    output.append(brush_box(-FOUND_X, FOUND_Y_N, -64, FOUND_X, FOUND_Y_N + W, FOUND_Z_TOP + W, CAULK))  # North
-    output.append(brush_box(-FOUND_X, FOUND_Y_S - W, -64, FOUND_X, FOUND_Y_S, FOUND_Z_TOP + W, CAULK))  # South
+    brushes.add_many([
+        (-FOUND_X, FOUND_Y_S, -64, FOUND_X, FOUND_Y_N, -W),
+        # Ceiling seal
+        (-FOUND_X, FOUND_Y_S, FOUND_Z_TOP, FOUND_X, FOUND_Y_N, FOUND_Z_TOP + W),
+        # Outer walls (complete box)
+        (-FOUND_X - W, FOUND_Y_S, -64, -FOUND_X, FOUND_Y_N, FOUND_Z_TOP + W),  # West
+        (FOUND_X, FOUND_Y_S, -64, FOUND_X + W, FOUND_Y_N, FOUND_Z_TOP + W),  # East
+        (-FOUND_X, FOUND_Y_N, -64, FOUND_X, FOUND_Y_N + W, FOUND_Z_TOP + W),  # North
+        (-FOUND_X, FOUND_Y_S - W, -64, FOUND_X, FOUND_Y_S, FOUND_Z_TOP + W),  # South
+    ], CAULK)
 
     # Main Hall (center hub)
     MAIN_W = 1024  # half-width
     MAIN_L = 1024  # half-length
     MAIN_H = 384   # height
+    MAIN_TOP = MAIN_H + W  # top of the ceiling brush
 
     # Galleries (side wings)
     GAL_W = 512
     GAL_L = 768
     GAL_H = 320
+    GAL_HL = GAL_L // 2
 
     # Corridors
     CORR_W = 192  # corridor width (half)
@@ -185,111 +259,131 @@ def generate_museum():
     # ============================================
 
     # Floor
-    output.append(brush_box(-MAIN_W, -MAIN_L, -W, MAIN_W, MAIN_L, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-MAIN_W, -MAIN_L, -W, MAIN_W, MAIN_L, 0,
+                FLOOR_FACES)
     # Ceiling
-    output.append(brush_box(-MAIN_W, -MAIN_L, MAIN_H, MAIN_W, MAIN_L, MAIN_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-MAIN_W, -MAIN_L, MAIN_H, MAIN_W, MAIN_L, MAIN_TOP,
+                CEIL_FACES)
 
     # Main Hall walls with openings
     DOOR_W = 256  # door width
 
     # North wall - opening to north corridor
-    output.append(brush_box(-MAIN_W, MAIN_L, 0, -DOOR_W, MAIN_L + W, MAIN_H, WALL))
-    output.append(brush_box(DOOR_W, MAIN_L, 0, MAIN_W, MAIN_L + W, MAIN_H, WALL))
-    output.append(brush_box(-DOOR_W, MAIN_L, CORR_H, DOOR_W, MAIN_L + W, MAIN_H, WALL))
+    brushes.add_many([
+        (-MAIN_W, MAIN_L, 0, -DOOR_W, MAIN_L + W, MAIN_H),
+        (DOOR_W, MAIN_L, 0, MAIN_W, MAIN_L + W, MAIN_H),
+        (-DOOR_W, MAIN_L, CORR_H, DOOR_W, MAIN_L + W, MAIN_H),
+    ], WALL)
 
     # South wall - opening to south corridor
-    output.append(brush_box(-MAIN_W, -MAIN_L - W, 0, -DOOR_W, -MAIN_L, MAIN_H, WALL))
-    output.append(brush_box(DOOR_W, -MAIN_L - W, 0, MAIN_W, -MAIN_L, MAIN_H, WALL))
-    output.append(brush_box(-DOOR_W, -MAIN_L - W, CORR_H, DOOR_W, -MAIN_L, MAIN_H, WALL))
+    brushes.add_many([
+        (-MAIN_W, -MAIN_L - W, 0, -DOOR_W, -MAIN_L, MAIN_H),
+        (DOOR_W, -MAIN_L - W, 0, MAIN_W, -MAIN_L, MAIN_H),
+        (-DOOR_W, -MAIN_L - W, CORR_H, DOOR_W, -MAIN_L, MAIN_H),
+    ], WALL)
 
     # East wall - opening to East Gallery
-    output.append(brush_box(MAIN_W, -MAIN_L, 0, MAIN_W + W, -DOOR_W, MAIN_H, WALL))
-    output.append(brush_box(MAIN_W, DOOR_W, 0, MAIN_W + W, MAIN_L, MAIN_H, WALL))
-    output.append(brush_box(MAIN_W, -DOOR_W, GAL_H, MAIN_W + W, DOOR_W, MAIN_H, WALL))
+    brushes.add_many([
+        (MAIN_W, -MAIN_L, 0, MAIN_W + W, -DOOR_W, MAIN_H),
+        (MAIN_W, DOOR_W, 0, MAIN_W + W, MAIN_L, MAIN_H),
+        (MAIN_W, -DOOR_W, GAL_H, MAIN_W + W, DOOR_W, MAIN_H),
+    ], WALL)
 
     # West wall - opening to West Gallery
-    output.append(brush_box(-MAIN_W - W, -MAIN_L, 0, -MAIN_W, -DOOR_W, MAIN_H, WALL))
-    output.append(brush_box(-MAIN_W - W, DOOR_W, 0, -MAIN_W, MAIN_L, MAIN_H, WALL))
-    output.append(brush_box(-MAIN_W - W, -DOOR_W, GAL_H, -MAIN_W, DOOR_W, MAIN_H, WALL))
+    brushes.add_many([
+        (-MAIN_W - W, -MAIN_L, 0, -MAIN_W, -DOOR_W, MAIN_H),
+        (-MAIN_W - W, DOOR_W, 0, -MAIN_W, MAIN_L, MAIN_H),
+        (-MAIN_W - W, -DOOR_W, GAL_H, -MAIN_W, DOOR_W, MAIN_H),
+    ], WALL)
 
     # ============================================
     # EAST GALLERY - Mac Exhibits
     # ============================================
     EAST_X = MAIN_W + W
     EAST_X2 = EAST_X + GAL_W
+    EAST_MID_X = EAST_X + GAL_W // 2
 
     # Floor (extend under door opening to MAIN_W)
-    output.append(brush_box(MAIN_W, -DOOR_W, -W, EAST_X2, DOOR_W, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    output.append(brush_box(EAST_X, DOOR_W, -W, EAST_X2, GAL_L//2, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    output.append(brush_box(EAST_X, -GAL_L//2, -W, EAST_X2, -DOOR_W, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add_many([
+        (MAIN_W, -DOOR_W, -W, EAST_X2, DOOR_W, 0),
+        (EAST_X, DOOR_W, -W, EAST_X2, GAL_HL, 0),
+        (EAST_X, -GAL_HL, -W, EAST_X2, -DOOR_W, 0),
+    ], FLOOR_FACES)
     # Ceiling
-    output.append(brush_box(EAST_X, -GAL_L//2, GAL_H, EAST_X2, GAL_L//2, GAL_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(EAST_X, -GAL_HL, GAL_H, EAST_X2, GAL_HL, GAL_H + W,
+                CEIL_FACES)
 
     # East Gallery walls (solid - no opening, simpler sealed design)
-    output.append(brush_box(EAST_X, GAL_L//2, 0, EAST_X2, GAL_L//2 + W, GAL_H, WALL_ACCENT))  # North
-    output.append(brush_box(EAST_X, -GAL_L//2 - W, 0, EAST_X2, -GAL_L//2, GAL_H, WALL_ACCENT))  # South (solid)
-    output.append(brush_box(EAST_X2, -GAL_L//2, 0, EAST_X2 + W, GAL_L//2, GAL_H, WALL_ACCENT))  # East
+    brushes.add_many([
+        (EAST_X, GAL_HL, 0, EAST_X2, GAL_HL + W, GAL_H),  # North
+        (EAST_X, -GAL_HL - W, 0, EAST_X2, -GAL_HL, GAL_H),  # South (solid)
+        (EAST_X2, -GAL_HL, 0, EAST_X2 + W, GAL_HL, GAL_H),  # East
+    ], WALL_ACCENT)
 
     # Fill gap between main hall east wall and gallery extent
     # Gallery goes from -GAL_L//2 to GAL_L//2, door is -DOOR_W to DOOR_W
     # Need walls from DOOR_W to GAL_L//2 and from -GAL_L//2 to -DOOR_W
-    output.append(brush_box(MAIN_W, DOOR_W, 0, EAST_X, GAL_L//2, GAL_H, CAULK))  # North gap fill
-    output.append(brush_box(MAIN_W, -GAL_L//2, 0, EAST_X, -DOOR_W, GAL_H, CAULK))  # South gap fill
-    # Fill gap between main hall and gallery ceiling
-    output.append(brush_box(MAIN_W, -DOOR_W, GAL_H + W, EAST_X, DOOR_W, MAIN_H + W, CAULK))
+    brushes.add_many([
+        (MAIN_W, DOOR_W, 0, EAST_X, GAL_HL, GAL_H),  # North gap fill
+        (MAIN_W, -GAL_HL, 0, EAST_X, -DOOR_W, GAL_H),  # South gap fill
+        # Fill gap between main hall and gallery ceiling
+        (MAIN_W, -DOOR_W, GAL_H + W, EAST_X, DOOR_W, MAIN_TOP),
+    ], CAULK)
 
     # ============================================
     # WEST GALLERY - Server/Terminal Exhibits
     # ============================================
     WEST_X2 = -MAIN_W - W
     WEST_X = WEST_X2 - GAL_W
+    WEST_MID_X = WEST_X + GAL_W // 2
 
     # Floor (extend under door opening to -MAIN_W)
-    output.append(brush_box(WEST_X, -DOOR_W, -W, -MAIN_W, DOOR_W, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    output.append(brush_box(WEST_X, DOOR_W, -W, WEST_X2, GAL_L//2, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
-    output.append(brush_box(WEST_X, -GAL_L//2, -W, WEST_X2, -DOOR_W, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add_many([
+        (WEST_X, -DOOR_W, -W, -MAIN_W, DOOR_W, 0),
+        (WEST_X, DOOR_W, -W, WEST_X2, GAL_HL, 0),
+        (WEST_X, -GAL_HL, -W, WEST_X2, -DOOR_W, 0),
+    ], FLOOR_FACES)
     # Ceiling
-    output.append(brush_box(WEST_X, -GAL_L//2, GAL_H, WEST_X2, GAL_L//2, GAL_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(WEST_X, -GAL_HL, GAL_H, WEST_X2, GAL_HL, GAL_H + W,
+                CEIL_FACES)
 
     # West Gallery walls (solid - no opening, simpler sealed design)
-    output.append(brush_box(WEST_X, GAL_L//2, 0, WEST_X2, GAL_L//2 + W, GAL_H, WALL_ACCENT))  # North
-    output.append(brush_box(WEST_X, -GAL_L//2 - W, 0, WEST_X2, -GAL_L//2, GAL_H, WALL_ACCENT))  # South (solid)
-    output.append(brush_box(WEST_X - W, -GAL_L//2, 0, WEST_X, GAL_L//2, GAL_H, WALL_ACCENT))  # West
+    brushes.add_many([
+        (WEST_X, GAL_HL, 0, WEST_X2, GAL_HL + W, GAL_H),  # North
+        (WEST_X, -GAL_HL - W, 0, WEST_X2, -GAL_HL, GAL_H),  # South (solid)
+        (WEST_X - W, -GAL_HL, 0, WEST_X, GAL_HL, GAL_H),  # West
+    ], WALL_ACCENT)
 
     # Fill gap between main hall west wall and gallery extent
-    output.append(brush_box(WEST_X2, DOOR_W, 0, -MAIN_W, GAL_L//2, GAL_H, CAULK))  # North gap fill
-    output.append(brush_box(WEST_X2, -GAL_L//2, 0, -MAIN_W, -DOOR_W, GAL_H, CAULK))  # South gap fill
-    # Fill gap between main hall and gallery ceiling
-    output.append(brush_box(WEST_X2, -DOOR_W, GAL_H + W, -MAIN_W, DOOR_W, MAIN_H + W, CAULK))
+    brushes.add_many([
+        (WEST_X2, DOOR_W, 0, -MAIN_W, GAL_HL, GAL_H),  # North gap fill
+        (WEST_X2, -GAL_HL, 0, -MAIN_W, -DOOR_W, GAL_H),  # South gap fill
+        # Fill gap between main hall and gallery ceiling
+        (WEST_X2, -DOOR_W, GAL_H + W, -MAIN_W, DOOR_W, MAIN_TOP),
+    ], CAULK)
 
     # ============================================
     # NORTH CORRIDOR - To Temple Wing
     # ============================================
     NORTH_CORR_L = 384
+    NORTH_CORR_END = MAIN_L + NORTH_CORR_L
+    NORTH_CORR_MID = MAIN_L + NORTH_CORR_L // 2
 
     # Floor
-    output.append(brush_box(-CORR_W, MAIN_L, -W, CORR_W, MAIN_L + NORTH_CORR_L, 0,
-                            [FLOOR2, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-CORR_W, MAIN_L, -W, CORR_W, NORTH_CORR_END, 0,
+                FLOOR2_FACES)
     # Ceiling
-    output.append(brush_box(-CORR_W, MAIN_L, CORR_H, CORR_W, MAIN_L + NORTH_CORR_L, CORR_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-CORR_W, MAIN_L, CORR_H, CORR_W, NORTH_CORR_END, CORR_H + W,
+                CEIL_FACES)
     # Walls
-    output.append(brush_box(-CORR_W - W, MAIN_L, 0, -CORR_W, MAIN_L + NORTH_CORR_L, CORR_H, TRIM))
-    output.append(brush_box(CORR_W, MAIN_L, 0, CORR_W + W, MAIN_L + NORTH_CORR_L, CORR_H, TRIM))
+    brushes.add_many([
+        (-CORR_W - W, MAIN_L, 0, -CORR_W, NORTH_CORR_END, CORR_H),
+        (CORR_W, MAIN_L, 0, CORR_W + W, NORTH_CORR_END, CORR_H),
+    ], TRIM)
     # End wall (temple entrance placeholder)
-    output.append(brush_box(-CORR_W, MAIN_L + NORTH_CORR_L, 0, CORR_W, MAIN_L + NORTH_CORR_L + W, CORR_H, WALL))
+    brushes.add_uniform(-CORR_W, NORTH_CORR_END, 0, CORR_W, NORTH_CORR_END + W, CORR_H, WALL)
     # Seal above corridor
-    output.append(brush_box(-CORR_W - W, MAIN_L, CORR_H + W, CORR_W + W, MAIN_L + NORTH_CORR_L + W, MAIN_H + W, CAULK))
+    brushes.add_uniform(-CORR_W - W, MAIN_L, CORR_H + W, CORR_W + W, NORTH_CORR_END + W, MAIN_TOP, CAULK)
 
     # ============================================
     # SOUTH CORRIDOR - To Hall 2
@@ -299,19 +393,23 @@ def generate_museum():
     SOUTH_CORR_END = SOUTH_CORR_START - SOUTH_CORR_L
 
     # Floor (extend under door opening to -MAIN_L)
-    output.append(brush_box(-CORR_W, SOUTH_CORR_END, -W, CORR_W, -MAIN_L, 0,
-                            [FLOOR2, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-CORR_W, SOUTH_CORR_END, -W, CORR_W, -MAIN_L, 0,
+                FLOOR2_FACES)
     # Ceiling
-    output.append(brush_box(-CORR_W, SOUTH_CORR_END, CORR_H, CORR_W, SOUTH_CORR_START, CORR_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-CORR_W, SOUTH_CORR_END, CORR_H, CORR_W, SOUTH_CORR_START, CORR_H + W,
+                CEIL_FACES)
     # Walls
-    output.append(brush_box(-CORR_W - W, SOUTH_CORR_END, 0, -CORR_W, SOUTH_CORR_START, CORR_H, TRIM))
-    output.append(brush_box(CORR_W, SOUTH_CORR_END, 0, CORR_W + W, SOUTH_CORR_START, CORR_H, TRIM))
+    brushes.add_many([
+        (-CORR_W - W, SOUTH_CORR_END, 0, -CORR_W, SOUTH_CORR_START, CORR_H),
+        (CORR_W, SOUTH_CORR_END, 0, CORR_W + W, SOUTH_CORR_START, CORR_H),
+    ], TRIM)
     # Seal above corridor
-    output.append(brush_box(-CORR_W - W, SOUTH_CORR_END, CORR_H + W, CORR_W + W, SOUTH_CORR_START, MAIN_H + W, CAULK))
-    # Seal the gap between main hall south wall and corridor start
-    output.append(brush_box(-MAIN_W - W, -MAIN_L - W, 0, -CORR_W - W, -MAIN_L, MAIN_H + W, CAULK))
-    output.append(brush_box(CORR_W + W, -MAIN_L - W, 0, MAIN_W + W, -MAIN_L, MAIN_H + W, CAULK))
+    brushes.add_many([
+        (-CORR_W - W, SOUTH_CORR_END, CORR_H + W, CORR_W + W, SOUTH_CORR_START, MAIN_TOP),
+        # Seal the gap between main hall south wall and corridor start
+        (-MAIN_W - W, -MAIN_L - W, 0, -CORR_W - W, -MAIN_L, MAIN_TOP),
+        (CORR_W + W, -MAIN_L - W, 0, MAIN_W + W, -MAIN_L, MAIN_TOP),
+    ], CAULK)
 
     # ============================================
     # HALL 2 - Vintage Computer Wing
@@ -320,48 +418,56 @@ def generate_museum():
     HALL2_END = HALL2_START - HALL2_L
 
     # Floor
-    output.append(brush_box(-HALL2_W, HALL2_END, -W, HALL2_W, HALL2_START, 0,
-                            [FLOOR, CAULK, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-HALL2_W, HALL2_END, -W, HALL2_W, HALL2_START, 0,
+                FLOOR_FACES)
     # Ceiling
-    output.append(brush_box(-HALL2_W, HALL2_END, HALL2_H, HALL2_W, HALL2_START, HALL2_H + W,
-                            [CAULK, CEILING, CAULK, CAULK, CAULK, CAULK]))
+    brushes.add(-HALL2_W, HALL2_END, HALL2_H, HALL2_W, HALL2_START, HALL2_H + W,
+                CEIL_FACES)
 
     # Hall 2 walls
     # North wall (with corridor opening)
-    output.append(brush_box(-HALL2_W, HALL2_START, 0, -CORR_W, HALL2_START + W, HALL2_H, WALL))
-    output.append(brush_box(CORR_W, HALL2_START, 0, HALL2_W, HALL2_START + W, HALL2_H, WALL))
-    output.append(brush_box(-CORR_W, HALL2_START, CORR_H, CORR_W, HALL2_START + W, HALL2_H, WALL))
+    brushes.add_many([
+        (-HALL2_W, HALL2_START, 0, -CORR_W, HALL2_START + W, HALL2_H),
+        (CORR_W, HALL2_START, 0, HALL2_W, HALL2_START + W, HALL2_H),
+        (-CORR_W, HALL2_START, CORR_H, CORR_W, HALL2_START + W, HALL2_H),
+    ], WALL)
 
     # South wall (solid)
-    output.append(brush_box(-HALL2_W, HALL2_END - W, 0, HALL2_W, HALL2_END, HALL2_H, WALL))
+    brushes.add_uniform(-HALL2_W, HALL2_END - W, 0, HALL2_W, HALL2_END, HALL2_H, WALL)
 
     # East wall (solid)
-    output.append(brush_box(HALL2_W, HALL2_END, 0, HALL2_W + W, HALL2_START, HALL2_H, WALL))
+    brushes.add_uniform(HALL2_W, HALL2_END, 0, HALL2_W + W, HALL2_START, HALL2_H, WALL)
 
     # West wall (solid)
-    output.append(brush_box(-HALL2_W - W, HALL2_END, 0, -HALL2_W, HALL2_START, HALL2_H, WALL))
+    brushes.add_uniform(-HALL2_W - W, HALL2_END, 0, -HALL2_W, HALL2_START, HALL2_H, WALL)
 
     # Fill corners between south corridor and Hall 2
-    output.append(brush_box(-HALL2_W - W, HALL2_START, 0, -CORR_W - W, HALL2_START + W, HALL2_H + W, CAULK))
-    output.append(brush_box(CORR_W + W, HALL2_START, 0, HALL2_W + W, HALL2_START + W, HALL2_H + W, CAULK))
+    brushes.add_many([
+        (-HALL2_W - W, HALL2_START, 0, -CORR_W - W, HALL2_START + W, HALL2_H + W),
+        (CORR_W + W, HALL2_START, 0, HALL2_W + W, HALL2_START + W, HALL2_H + W),
+    ], CAULK)
 
     # Additional sealing between south corridor end and Hall 2 start
     # The corridor ends at SOUTH_CORR_END, Hall 2 starts at HALL2_START (same value)
     # Need to seal the vertical walls of the corridor where it meets Hall 2
-    output.append(brush_box(-CORR_W - W, HALL2_START - W, 0, -CORR_W, HALL2_START, HALL2_H + W, CAULK))
-    output.append(brush_box(CORR_W, HALL2_START - W, 0, CORR_W + W, HALL2_START, HALL2_H + W, CAULK))
+    brushes.add_many([
+        (-CORR_W - W, HALL2_START - W, 0, -CORR_W, HALL2_START, HALL2_H + W),
+        (CORR_W, HALL2_START - W, 0, CORR_W + W, HALL2_START, HALL2_H + W),
+    ], CAULK)
 
     # ============================================
     # SEAL CORNERS - between main hall and galleries
     # ============================================
     # NE corner gap
-    output.append(brush_box(MAIN_W, DOOR_W, 0, MAIN_W + W, GAL_L//2, MAIN_H + W, CAULK))
-    # SE corner gap
-    output.append(brush_box(MAIN_W, -GAL_L//2, 0, MAIN_W + W, -DOOR_W, MAIN_H + W, CAULK))
-    # NW corner gap
-    output.append(brush_box(-MAIN_W - W, DOOR_W, 0, -MAIN_W, GAL_L//2, MAIN_H + W, CAULK))
-    # SW corner gap
-    output.append(brush_box(-MAIN_W - W, -GAL_L//2, 0, -MAIN_W, -DOOR_W, MAIN_H + W, CAULK))
+    brushes.add_many([
+        (MAIN_W, DOOR_W, 0, MAIN_W + W, GAL_HL, MAIN_TOP),
+        # SE corner gap
+        (MAIN_W, -GAL_HL, 0, MAIN_W + W, -DOOR_W, MAIN_TOP),
+        # NW corner gap
+        (-MAIN_W - W, DOOR_W, 0, -MAIN_W, GAL_HL, MAIN_TOP),
+        # SW corner gap
+        (-MAIN_W - W, -GAL_HL, 0, -MAIN_W, -DOOR_W, MAIN_TOP),
+    ], CAULK)
 
     # ============================================
     # MEZZANINE with proper stairs (Main Hall)
@@ -370,15 +476,18 @@ def generate_museum():
     MEZZ_L = 512
     MEZZ_H = 160
     MEZZ_THICK = 16
+    MEZZ_HW = MEZZ_W // 2
+    MEZZ_TOP = MEZZ_H + MEZZ_THICK
+    MEZZ_MID_Y = MAIN_L - MEZZ_L // 2 - 64
 
     # Mezzanine platform (north side of main hall)
-    output.append(brush_box(-MEZZ_W//2, MAIN_L - MEZZ_L - 64, MEZZ_H,
-                            MEZZ_W//2, MAIN_L - 64, MEZZ_H + MEZZ_THICK,
-                            [FLOOR, CEILING, WALL, WALL, WALL, WALL]))
+    brushes.add(-MEZZ_HW, MAIN_L - MEZZ_L - 64, MEZZ_H,
+                MEZZ_HW, MAIN_L - 64, MEZZ_TOP,
+                MEZZ_FACES)
 
     # Railing (south edge)
-    output.append(brush_box(-MEZZ_W//2, MAIN_L - MEZZ_L - 64, MEZZ_H + MEZZ_THICK,
-                            MEZZ_W//2, MAIN_L - MEZZ_L - 56, MEZZ_H + MEZZ_THICK + 40, TRIM))
+    brushes.add_uniform(-MEZZ_HW, MAIN_L - MEZZ_L - 64, MEZZ_TOP,
+                        MEZZ_HW, MAIN_L - MEZZ_L - 56, MEZZ_TOP + 40, TRIM)
 
     # Stairs going down to east
     STAIR_W = 128
@@ -387,26 +496,28 @@ def generate_museum():
     STEP_H = MEZZ_H // NUM_STEPS
     STEP_D = STAIR_L // NUM_STEPS
 
-    STAIR_X = MEZZ_W//2
-    STAIR_Y = MAIN_L - MEZZ_L//2 - 64
+    STAIR_X = MEZZ_HW
+    STAIR_Y = MEZZ_MID_Y
+    STAIR_HW = STAIR_W // 2
 
     # Solid base under stairs
-    output.append(brush_box(STAIR_X, STAIR_Y - STAIR_W//2, 0,
-                            STAIR_X + STAIR_L, STAIR_Y + STAIR_W//2, MEZZ_H, CAULK))
+    brushes.add_uniform(STAIR_X, STAIR_Y - STAIR_HW, 0,
+                        STAIR_X + STAIR_L, STAIR_Y + STAIR_HW, MEZZ_H, CAULK)
 
     # Step treads
-    for i in range(NUM_STEPS):
-        step_z = (NUM_STEPS - 1 - i) * STEP_H
-        step_x = STAIR_X + i * STEP_D
-        output.append(brush_box(step_x, STAIR_Y - STAIR_W//2, step_z,
-                                step_x + STEP_D, STAIR_Y + STAIR_W//2, step_z + STEP_H,
-                                [FLOOR, CAULK, TRIM, TRIM, TRIM, CAULK]))
+    step_xs = range(STAIR_X, STAIR_X + NUM_STEPS * STEP_D, STEP_D)
+    step_zs = reversed(range(0, NUM_STEPS * STEP_H, STEP_H))
+    brushes.add_many(
+        [(sx, STAIR_Y - STAIR_HW, sz, sx + STEP_D, STAIR_Y + STAIR_HW, sz + STEP_H)
+         for sx, sz in zip(step_xs, step_zs)],
+        STEP_FACES)
 
     # ============================================
     # EXHIBIT PEDESTALS
     # ============================================
     PED_SIZE = 80
     PED_H = 48
+    PED_HALF = PED_SIZE // 2
 
     # Mac pedestals in East Gallery
     mac_positions = [
@@ -415,10 +526,10 @@ def generate_museum():
         (EAST_X + 320, -200),
         (EAST_X + 320, 200),
     ]
-    for px, py in mac_positions:
-        output.append(brush_box(px - PED_SIZE//2, py - PED_SIZE//2, 0,
-                                px + PED_SIZE//2, py + PED_SIZE//2, PED_H,
-                                [PEDESTAL, FLOOR, TRIM, TRIM, TRIM, TRIM]))
+    brushes.add_many(
+        [(px - PED_HALF, py - PED_HALF, 0, px + PED_HALF, py + PED_HALF, PED_H)
+         for px, py in mac_positions],
+        PED_FACES)
 
     # Server pedestals in West Gallery
     server_positions = [
@@ -427,14 +538,14 @@ def generate_museum():
         (WEST_X + 320, -200),
         (WEST_X + 320, 200),
     ]
-    for px, py in server_positions:
-        output.append(brush_box(px - PED_SIZE, py - PED_SIZE//2, 0,
-                                px + PED_SIZE, py + PED_SIZE//2, PED_H,
-                                [PEDESTAL, FLOOR, TRIM, TRIM, TRIM, TRIM]))
+    brushes.add_many(
+        [(px - PED_SIZE, py - PED_HALF, 0, px + PED_SIZE, py + PED_HALF, PED_H)
+         for px, py in server_positions],
+        PED_FACES)
 
     # Center display in Main Hall
-    output.append(brush_box(-100, -80, 0, 100, 80, 64,
-                            [PEDESTAL, FLOOR, TRIM, TRIM, TRIM, TRIM]))
+    brushes.add(-100, -80, 0, 100, 80, 64,
+                PED_FACES)
 
     # Display pedestals in Hall 2
     HALL2_CENTER = (HALL2_START + HALL2_END) // 2
@@ -445,33 +556,35 @@ def generate_museum():
         (500, HALL2_CENTER + 200),
         (0, HALL2_CENTER),
     ]
-    for px, py in hall2_positions:
-        output.append(brush_box(px - PED_SIZE//2, py - PED_SIZE//2, 0,
-                                px + PED_SIZE//2, py + PED_SIZE//2, PED_H,
-                                [PEDESTAL, FLOOR, TRIM, TRIM, TRIM, TRIM]))
+    brushes.add_many(
+        [(px - PED_HALF, py - PED_HALF, 0, px + PED_HALF, py + PED_HALF, PED_H)
+         for px, py in hall2_positions],
+        PED_FACES)
 
     # ============================================
     # PILLARS
     # ============================================
     PILLAR = 64
+    PILLAR_HALF = PILLAR // 2
 
     # Main Hall pillars
     main_pillars = [(-700, -700), (700, -700), (-700, 700), (700, 700)]
-    for px, py in main_pillars:
-        output.append(brush_box(px - PILLAR//2, py - PILLAR//2, 0,
-                                px + PILLAR//2, py + PILLAR//2, MAIN_H - 32,
-                                [CEILING, FLOOR, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX]))
+    brushes.add_many(
+        [(px - PILLAR_HALF, py - PILLAR_HALF, 0, px + PILLAR_HALF, py + PILLAR_HALF, MAIN_H - 32)
+         for px, py in main_pillars],
+        PILLAR_FACES)
 
     # Hall 2 pillars
     hall2_pillars = [(-600, HALL2_CENTER - 250), (600, HALL2_CENTER - 250),
                      (-600, HALL2_CENTER + 250), (600, HALL2_CENTER + 250)]
-    for px, py in hall2_pillars:
-        output.append(brush_box(px - PILLAR//2, py - PILLAR//2, 0,
-                                px + PILLAR//2, py + PILLAR//2, HALL2_H - 32,
-                                [CEILING, FLOOR, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX, PILLAR_TEX]))
+    brushes.add_many(
+        [(px - PILLAR_HALF, py - PILLAR_HALF, 0, px + PILLAR_HALF, py + PILLAR_HALF, HALL2_H - 32)
+         for px, py in hall2_pillars],
+        PILLAR_FACES)
 
     # Close worldspawn
-    output.append("}")
+    brushes.write(out)
+    out.write("}\n")
 
     # ============================================
     # MODELS
@@ -479,7 +592,7 @@ def generate_museum():
 
     # Mac computers in East Gallery
     for i, (px, py) in enumerate(mac_positions):
-        output.append(misc_model(f"{px} {py} {PED_H}", "models/props/macintosh.iqm", angle=270, scale=1.0))
+        out.write(misc_model((px, py, PED_H), "models/props/macintosh.iqm", angle=270, scale=1.0))
 
     # Servers in West Gallery
     server_models = [
@@ -490,10 +603,10 @@ def generate_museum():
     ]
     for i, (px, py) in enumerate(server_positions):
         model, scale = server_models[i % len(server_models)]
-        output.append(misc_model(f"{px} {py} {PED_H}", model, angle=90, scale=scale))
+        out.write(misc_model((px, py, PED_H), model, angle=90, scale=scale))
 
     # BSOD PC on center display
-    output.append(misc_model("0 0 72", "models/props/bsod_pc.iqm", angle=180, scale=2.0))
+    out.write(misc_model((0, 0, 72), "models/props/bsod_pc.iqm", angle=180, scale=2.0))
 
     # Hall 2 vintage displays
     vintage_models = [
@@ -505,127 +618,128 @@ def generate_museum():
     ]
     for i, (px, py) in enumerate(hall2_positions):
         model, scale = vintage_models[i % len(vintage_models)]
-        output.append(misc_model(f"{px} {py} {PED_H + 8}", model, angle=0, scale=scale))
+        out.write(misc_model((px, py, PED_H + 8), model, angle=0, scale=scale))
+
+    # Positions shared by spawns, weapons and items
+    MAIN_CENTER_SPOT = (0, 0, 16)
+    MEZZ_SPOT = (0, MEZZ_MID_Y, MEZZ_TOP + 16)
+    NORTH_CORR_SPOT = (0, NORTH_CORR_MID, 16)
+    EAST_GAL_SPOT = (EAST_MID_X, 0, 16)
+    WEST_GAL_SPOT = (WEST_MID_X, 0, 16)
+    HALL2_PEDESTAL_SPOT = (0, HALL2_CENTER, 64)
 
     # ============================================
     # SPAWN POINTS - Distributed throughout
     # ============================================
     spawns = [
         # Main Hall
-        ("0 0 16", "0"),
-        ("-500 -500 16", "45"),
-        ("500 500 16", "225"),
-        ("500 -500 16", "315"),
-        ("-500 500 16", "135"),
+        (MAIN_CENTER_SPOT, 0),
+        ((-500, -500, 16), 45),
+        ((500, 500, 16), 225),
+        ((500, -500, 16), 315),
+        ((-500, 500, 16), 135),
         # Mezzanine
-        (f"0 {MAIN_L - MEZZ_L//2 - 64} {MEZZ_H + MEZZ_THICK + 16}", "180"),
+        (MEZZ_SPOT, 180),
         # North corridor
-        (f"0 {MAIN_L + NORTH_CORR_L//2} 16", "180"),
+        (NORTH_CORR_SPOT, 180),
         # East Gallery
-        (f"{EAST_X + GAL_W//2} 0 16", "270"),
-        (f"{EAST_X + 200} 200 16", "270"),
+        (EAST_GAL_SPOT, 270),
+        ((EAST_X + 200, 200, 16), 270),
         # West Gallery
-        (f"{WEST_X + GAL_W//2} 0 16", "90"),
-        (f"{WEST_X + 200} -200 16", "90"),
+        (WEST_GAL_SPOT, 90),
+        ((WEST_X + 200, -200, 16), 90),
         # Hall 2
-        (f"0 {HALL2_CENTER} 16", "0"),
-        (f"600 {HALL2_CENTER} 16", "270"),
-        (f"-600 {HALL2_CENTER} 16", "90"),
+        ((0, HALL2_CENTER, 16), 0),
+        ((600, HALL2_CENTER, 16), 270),
+        ((-600, HALL2_CENTER, 16), 90),
     ]
 
-    for origin, angle in spawns:
-        output.append(entity("info_player_deathmatch", {"origin": origin, "angle": angle}))
+    out.writelines(starmap(_SPAWN_TEMPLATE.format, spawns))
 
     # ============================================
     # WEAPONS - Strategic placement
     # ============================================
     weapons = [
         # Main Hall
-        ("weapon_machinegun", "0 -600 16"),
-        ("weapon_machinegun", "0 600 16"),
-        ("weapon_electro", "-600 0 16"),
-        ("weapon_crylink", "600 0 16"),
-        ("weapon_vortex", "0 0 80"),  # On center pedestal
+        ("weapon_machinegun", (0, -600, 16)),
+        ("weapon_machinegun", (0, 600, 16)),
+        ("weapon_electro", (-600, 0, 16)),
+        ("weapon_crylink", (600, 0, 16)),
+        ("weapon_vortex", (0, 0, 80)),  # On center pedestal
         # North corridor
-        ("weapon_shotgun", f"0 {MAIN_L + NORTH_CORR_L//2} 16"),
+        ("weapon_shotgun", NORTH_CORR_SPOT),
         # East Gallery
-        ("weapon_hagar", f"{EAST_X + GAL_W//2} 0 16"),
-        ("weapon_rifle", f"{EAST_X + 200} -200 16"),
+        ("weapon_hagar", EAST_GAL_SPOT),
+        ("weapon_rifle", (EAST_X + 200, -200, 16)),
         # West Gallery
-        ("weapon_mortar", f"{WEST_X + GAL_W//2} 0 16"),
-        ("weapon_devastator", f"{WEST_X + 200} 200 16"),
+        ("weapon_mortar", WEST_GAL_SPOT),
+        ("weapon_devastator", (WEST_X + 200, 200, 16)),
         # Hall 2
-        ("weapon_vortex", f"0 {HALL2_CENTER} 64"),
-        ("weapon_shotgun", f"400 {HALL2_CENTER + 300} 16"),
-        ("weapon_shotgun", f"-400 {HALL2_CENTER - 300} 16"),
+        ("weapon_vortex", HALL2_PEDESTAL_SPOT),
+        ("weapon_shotgun", (400, HALL2_CENTER + 300, 16)),
+        ("weapon_shotgun", (-400, HALL2_CENTER - 300, 16)),
         # Mezzanine (height advantage)
-        ("weapon_rifle", f"0 {MAIN_L - MEZZ_L//2 - 64} {MEZZ_H + MEZZ_THICK + 16}"),
+        ("weapon_rifle", MEZZ_SPOT),
     ]
 
-    for weapon, origin in weapons:
-        output.append(entity(weapon, {"origin": origin}))
+    out.writelines(starmap(_PICKUP_TEMPLATE.format, weapons))
 
     # ============================================
     # HEALTH AND ARMOR
     # ============================================
     items = [
-        ("item_health_mega", f"0 {HALL2_CENTER} 64"),  # Mega health on Hall 2 pedestal
-        ("item_armor_large", "0 0 16"),  # Armor in Main Hall center
-        ("item_health_large", f"{EAST_X + GAL_W//2} -200 16"),
-        ("item_health_large", f"{WEST_X + GAL_W//2} 200 16"),
-        ("item_armor_small", f"0 {MAIN_L + NORTH_CORR_L//2 - 64} 16"),
-        ("item_armor_small", f"0 {MAIN_L + NORTH_CORR_L//2 + 64} 16"),
+        ("item_health_mega", HALL2_PEDESTAL_SPOT),  # Mega health on Hall 2 pedestal
+        ("item_armor_large", MAIN_CENTER_SPOT),  # Armor in Main Hall center
+        ("item_health_large", (EAST_MID_X, -200, 16)),
+        ("item_health_large", (WEST_MID_X, 200, 16)),
+        ("item_armor_small", (0, NORTH_CORR_MID - 64, 16)),
+        ("item_armor_small", (0, NORTH_CORR_MID + 64, 16)),
     ]
 
-    for item, origin in items:
-        output.append(entity(item, {"origin": origin}))
+    out.writelines(starmap(_PICKUP_TEMPLATE.format, items))
 
     # ============================================
     # LIGHTS
     # ============================================
     lights = [
         # Main Hall - central
-        ("0 0 320", "1200", "1.0 0.95 0.9"),
+        ((0, 0, 320), 1200, "1.0 0.95 0.9"),
         # Main Hall - corners
-        ("-700 -700 300", "500", "1.0 0.9 0.8"),
-        ("700 700 300", "500", "1.0 0.9 0.8"),
-        ("700 -700 300", "500", "1.0 0.9 0.8"),
-        ("-700 700 300", "500", "1.0 0.9 0.8"),
+        ((-700, -700, 300), 500, "1.0 0.9 0.8"),
+        ((700, 700, 300), 500, "1.0 0.9 0.8"),
+        ((700, -700, 300), 500, "1.0 0.9 0.8"),
+        ((-700, 700, 300), 500, "1.0 0.9 0.8"),
         # East Gallery
-        (f"{EAST_X + GAL_W//2} 0 280", "600", "0.8 0.9 1.0"),
-        (f"{EAST_X + 128} -200 120", "250", "1.0 1.0 1.0"),
-        (f"{EAST_X + 128} 200 120", "250", "1.0 1.0 1.0"),
+        ((EAST_MID_X, 0, 280), 600, "0.8 0.9 1.0"),
+        ((EAST_X + 128, -200, 120), 250, "1.0 1.0 1.0"),
+        ((EAST_X + 128, 200, 120), 250, "1.0 1.0 1.0"),
         # West Gallery
-        (f"{WEST_X + GAL_W//2} 0 280", "600", "0.7 0.8 1.0"),
-        (f"{WEST_X + 128} -200 120", "250", "0.9 0.9 1.0"),
-        (f"{WEST_X + 128} 200 120", "250", "0.9 0.9 1.0"),
+        ((WEST_MID_X, 0, 280), 600, "0.7 0.8 1.0"),
+        ((WEST_X + 128, -200, 120), 250, "0.9 0.9 1.0"),
+        ((WEST_X + 128, 200, 120), 250, "0.9 0.9 1.0"),
         # North corridor
-        (f"0 {MAIN_L + NORTH_CORR_L//2} 200", "400", "0.8 1.0 0.9"),
+        ((0, NORTH_CORR_MID, 200), 400, "0.8 1.0 0.9"),
         # South corridor
-        (f"0 {SOUTH_CORR_END + SOUTH_CORR_L//2} 200", "400", "0.9 0.8 1.0"),
+        ((0, SOUTH_CORR_END + SOUTH_CORR_L//2, 200), 400, "0.9 0.8 1.0"),
         # Hall 2
-        (f"0 {HALL2_CENTER} 300", "1000", "0.7 0.85 1.0"),
-        (f"-500 {HALL2_CENTER} 200", "400", "1.0 0.8 0.4"),
-        (f"500 {HALL2_CENTER} 200", "400", "0.5 1.0 0.6"),
+        ((0, HALL2_CENTER, 300), 1000, "0.7 0.85 1.0"),
+        ((-500, HALL2_CENTER, 200), 400, "1.0 0.8 0.4"),
+        ((500, HALL2_CENTER, 200), 400, "0.5 1.0 0.6"),
         # Mezzanine
-        (f"0 {MAIN_L - MEZZ_L//2 - 64} 280", "400", "1.0 0.8 0.6"),
+        ((0, MEZZ_MID_Y, 280), 400, "1.0 0.8 0.6"),
     ]
 
-    for origin, light, color in lights:
-        output.append(entity("light", {"origin": origin, "light": light, "_color": color}))
-
-    return "\n".join(output)
+    out.writelines(starmap(_LIGHT_TEMPLATE.format, lights))
 
 
 if __name__ == "__main__":
-    map_content = generate_museum()
-
     output_path = "/home/scott/Games/Xonotic/mapping/maps/rustchain_museum.map"
     with open(output_path, "w") as f:
-        f.write(map_content)
+        generate_museum(f)
+        size = f.tell()
 
     print(f"Generated {output_path}")
-    print(f"Size: {len(map_content)} bytes")
+    print(f"Size: {size} bytes")
     print()
     print("Arena Flow Features:")
     print("  - Central Main Hall hub with 4 exits (N/S/E/W)")